@@ -9,11 +9,13 @@ class LED:
         self.pin = pin
 
         GPIO.setmode(GPIO.BOARD)
-        GPIO.setup(self.pin, GPIO.OUT)
+        GPIO.setup(self.pin, GPIO.OUT, initial=GPIO.LOW)
         self.blink_changed = 0
         self.on = False
 
     def toggle(self, condition):
+        if bool(condition) == self.on:
+            return
         if condition:
             GPIO.output(self.pin, GPIO.HIGH)
             self.on = True
@@ -22,9 +24,10 @@ class LED:
             self.on = False            
 
     def blink(self, rate):
-        if time.time() - self.blink_changed > rate:
+        now = time.monotonic()
+        if now - self.blink_changed > rate:
             self.toggle(not self.on)
-            self.blink_changed = time.time()
+            self.blink_changed = now
 
     def run(self, blink_rate):
         if blink_rate == 0:
@@ -59,9 +62,10 @@ class RGB_LED:
         self.pwm_r = GPIO.PWM(self.pin_r, freq)
         self.pwm_g = GPIO.PWM(self.pin_g, freq)
         self.pwm_b = GPIO.PWM(self.pin_b, freq)
-        self.pwm_r.start(0)
-        self.pwm_g.start(0)
-        self.pwm_b.start(0)
+        self.duty = (0, 0, 0)
+        self.pwm_r.start(self.duty[0])
+        self.pwm_g.start(self.duty[1])
+        self.pwm_b.start(self.duty[2])
         self.zero = 0
         if( self.invert ):
             self.zero = 100
@@ -81,9 +85,10 @@ class RGB_LED:
             self.on = False
 
     def blink(self, rate):
-        if time.time() - self.blink_changed > rate:
+        now = time.monotonic()
+        if now - self.blink_changed > rate:
             self.toggle(not self.on)
-            self.blink_changed = time.time()
+            self.blink_changed = now
 
     def run(self, blink_rate):
         if blink_rate == 0:
@@ -101,6 +106,11 @@ class RGB_LED:
         self.set_rgb_duty(r, g, b)
 
     def set_rgb_duty(self, r, g, b):
+        # run() is called every vehicle loop, skip the pwm writes when
+        # the duty cycle is already what we want
+        if (r, g, b) == self.duty:
+            return
+        self.duty = (r, g, b)
         self.pwm_r.ChangeDutyCycle(r)
         self.pwm_g.ChangeDutyCycle(g)
         self.pwm_b.ChangeDutyCycle(b)